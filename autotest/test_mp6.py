@@ -12,7 +12,14 @@ from pytest_cases import parametrize_with_cases
 import flopy
 from flopy.discretization import StructuredGrid
 from flopy.export.shapefile_utils import shp2recarray
-from flopy.modflow import Modflow, ModflowMnw2
+from flopy.modflow import (
+    Modflow,
+    ModflowBas,
+    ModflowDis,
+    ModflowLpf,
+    ModflowMnw2,
+    ModflowOc,
+)
 from flopy.modpath import Modpath6, Modpath6Bas
 from flopy.modpath.mp6sim import Modpath6Sim, StartingLocationsFile
 from flopy.plot import PlotMapView
@@ -839,3 +846,153 @@ def test_mp_wpandas_wo_pandas(ml):
     with open(mp_no_pandas.get_package("loc").fn_path, "r") as f:
         particles_no_pandas = f.readlines()
     assert particles_pandas == particles_no_pandas
+
+
+def make_mp_loc_model(ws, use_pandas, npt=10):
+    m = Modflow("mf", model_ws=ws)
+    ModflowDis(m, nlay=2, nrow=3, ncol=4)
+    ModflowBas(m)
+    ModflowLpf(m, ipakcb=53)
+    ModflowOc(m)
+    mp = Modpath6(
+        modelname="pandas" if use_pandas else "no_pandas",
+        modflowmodel=m,
+        model_ws=ws,
+    )
+    Modpath6Bas(mp, prsity=0.30)
+    stl = StartingLocationsFile(model=mp, use_pandas=use_pandas)
+    stldata = stl.get_empty_starting_locations_data(npt=npt)
+    stldata["k0"] = np.arange(npt) % 2
+    stldata["i0"] = np.arange(npt) % 3
+    stldata["j0"] = np.arange(npt) % 4
+    stldata["xloc0"] = np.linspace(0.0, 1.0, npt)
+    stldata["initialtime"] = 1.5
+    stldata["label"] = [f"p{i + 1}" for i in range(npt)]
+    stl.data = stldata
+    return stl
+
+
+@requires_pkg("pandas")
+def test_loc_file_wpandas_wo_pandas(function_tmpdir):
+    stl_pandas = make_mp_loc_model(function_tmpdir, use_pandas=True)
+    stl_no_pandas = make_mp_loc_model(function_tmpdir, use_pandas=False)
+    # labels are utf-8 encoded
+    for stl in (stl_pandas, stl_no_pandas):
+        stl.data["label"][0] = "é1".encode()
+    # chunks that do not divide the number of particles evenly
+    stl_pandas.write_file(chunksize=3)
+    stl_no_pandas.write_file(chunksize=4)
+
+    with open(stl_pandas.fn_path, encoding="utf-8") as f:
+        particles_pandas = f.readlines()
+    with open(stl_no_pandas.fn_path, encoding="utf-8") as f:
+        particles_no_pandas = f.readlines()
+    assert particles_pandas == particles_no_pandas
+    assert particles_no_pandas[5].split()[-1] == "é1"
+    assert particles_no_pandas[3:5] == ["group1\n", "10\n"]
+    assert (
+        particles_no_pandas[-1]
+        == "10 1 1 2 1 2 1.00000000 0.50000000 0.00000000 1.50000000 p10\n"
+    )
+    # zero-based indices must not be modified by writing the file
+    assert stl_no_pandas.data["k0"].max() == 1
+    for chunksize in (0, -1):
+        with pytest.raises(ValueError, match="chunksize"):
+            stl_pandas.write_file(chunksize=chunksize)
+
+
+@requires_pkg("pyarrow")
+def test_loc_file_parquet(function_tmpdir):
+    import pyarrow.parquet as pq
+
+    stl = make_mp_loc_model(function_tmpdir, use_pandas=False)
+    stl.write_file(fmt="parquet")
+
+    table = pq.read_table(function_tmpdir / "no_pandas.parquet")
+    assert table.column_names == list(stl.data.dtype.names)
+    assert table.column("k0").to_pylist() == stl.data["k0"].tolist()
+    assert table.column("label").to_pylist()[-1] == "p10"
+    assert not (function_tmpdir / "no_pandas.loc").exists()
+
+
+def test_mpsim_advobs(function_tmpdir):
+    mp = make_mp_loc_model(function_tmpdir, use_pandas=False).parent
+    sim = Modpath6Sim(
+        model=mp, option_flags=[3, 1, 1, 1, 1, 1, 2, 1, 1, 1, 1, 2]
+    )
+    sim.write_file()
+
+    with open(sim.fn_path) as f:
+        lines = f.read().splitlines()
+    assert lines[5:8] == [
+        "no_pandas.mpend",
+        "no_pandas.mp.tim_ser",
+        "no_pandas.mp.advobs",
+    ]
+
+    # items must follow option flags changed after the first write
+    sim.option_flags[11] = 1
+    sim.write_file()
+    with open(sim.fn_path) as f:
+        lines = f.read().splitlines()
+    assert sim.options_dict["AdvectiveObservationsOption"] == 1
+    assert lines[4].split()[-1] == "1"
+    assert "no_pandas.mp.advobs" not in lines
+    # options_dict is derived from option_flags and cannot drift from them
+    with pytest.raises(AttributeError):
+        sim.options_dict = {}
+
+
+@pytest.mark.parametrize(
+    "use_pandas", [pytest.param(True, marks=requires_pkg("pandas")), False]
+)
+def test_loc_file_as_dict(function_tmpdir, use_pandas):
+    stl = make_mp_loc_model(function_tmpdir, use_pandas=use_pandas)
+    stl.write_file()
+    with open(stl.fn_path) as f:
+        particles_recarray = f.readlines()
+
+    stldata = stl.get_empty_starting_locations_data(npt=10, as_dict=True)
+    assert isinstance(stldata, dict)
+    for name in stldata:
+        stldata[name][:] = stl.data[name]
+    stl.data = stldata
+    stl.write_file()
+    with open(stl.fn_path) as f:
+        particles_dict = f.readlines()
+    assert particles_dict == particles_recarray
+
+
+def test_mpsim_reuses_array_entries(function_tmpdir):
+    mp = make_mp_loc_model(function_tmpdir, use_pandas=False).parent
+    zone = np.arange(24).reshape((2, 3, 4)) % 3 + 1
+    sim = Modpath6Sim(
+        model=mp,
+        option_flags=[1, 2, 1, 1, 1, 2, 2, 1, 2, 2, 2, 1],
+        zone=zone,
+        retard_fac=1.5,
+        retard_fcCB=zone * 0.5,
+    )
+
+    def expected_entries():
+        return "".join(
+            u3d.get_file_entry()
+            for u3d in (sim.zone, sim.retard_fac, sim.retard_fcCB)
+        )
+
+    sim.write_file()
+    with open(sim.fn_path) as f:
+        first = f.read()
+    assert first.endswith(expected_entries())
+
+    sim.write_file()
+    with open(sim.fn_path) as f:
+        assert f.read() == first
+
+    # changed values must not be served from the cache
+    sim.zone[1]._array[0, 0] = 9
+    sim.write_file()
+    with open(sim.fn_path) as f:
+        second = f.read()
+    assert second != first
+    assert second.endswith(expected_entries())
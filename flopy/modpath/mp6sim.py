@@ -7,6 +7,9 @@ MODFLOW Guide
 <https://water.usgs.gov/ogw/modflow/MODFLOW-2005-Guide/dis.html>`_.
 
 """
+import io
+import os
+
 import numpy as np
 
 from ..pakbase import Package
@@ -18,6 +21,46 @@ pd = import_optional_dependency(
     errors="ignore",
 )
 
+# buffer size used when writing the simulation and starting locations files
+_BUFFER_SIZE = 1 << 20
+
+# dtype of the particle id, group, grid and cell index fields
+_INDEX_DTYPE = np.int32
+
+# starting locations fields written for each particle
+_OUT_COLS = [
+    "particleid",
+    "particlegroup",
+    "initialgrid",
+    "k0",
+    "i0",
+    "j0",
+    "xloc0",
+    "yloc0",
+    "zloc0",
+    "initialtime",
+    "label",
+]
+
+
+def _printf_format(float_format):
+    """
+    Convert a python format string, e.g. "{:.8f}", to the equivalent
+    printf-style format, e.g. "%.8f", used by np.char.mod and pandas.
+    """
+    return float_format.replace("{", "").replace("}", "").replace(":", "%")
+
+
+def _to_csv(df, **kwargs):
+    """
+    Return a DataFrame as space delimited text without header or index.
+    A StringIO with newline=None is used so the os.linesep line terminators
+    written by pandas are normalized to "\n".
+    """
+    buf = io.StringIO(newline=None)
+    df.to_csv(buf, sep=" ", header=False, index=False, **kwargs)
+    return buf.getvalue()
+
 
 class Modpath6Sim(Package):
     """
@@ -55,6 +98,24 @@ class Modpath6Sim(Package):
 
     """
 
+    # names of the twelve option flags in item 3
+    _OPTION_NAMES = (
+        "SimulationType",
+        "TrackingDirection",
+        "WeakSinkOption",
+        "WeakSourceOption",
+        "ReferenceTimeOption",
+        "StopOption",
+        "ParticleGenerationOption",
+        "TimePointOption",
+        "BudgetOutputOption",
+        "ZoneArrayOption",
+        "RetardationOption",
+        "AdvectiveObservationsOption",
+    )
+    # format of the option flags in item 3
+    _FLAG_FMT = "%4d" * 12 + "\n"
+
     def __init__(
         self,
         model,
@@ -96,23 +157,9 @@ class Modpath6Sim(Package):
         self.heading2 = "#"
         self.mp_name_file = f"{model.name}.mpnam"
         self.mp_list_file = f"{model.name}.mplst"
-        options_list = [
-            "SimulationType",
-            "TrackingDirection",
-            "WeakSinkOption",
-            "WeakSourceOption",
-            "ReferenceTimeOption",
-            "StopOption",
-            "ParticleGenerationOption",
-            "TimePointOption",
-            "BudgetOutputOption",
-            "ZoneArrayOption",
-            "RetardationOption",
-            "AdvectiveObservationsOption",
-        ]
         self.option_flags = option_flags
-        options_dict = dict(list(zip(options_list, option_flags)))
-        self.options_dict = options_dict
+        # write_file items selected for the option flags
+        self._item_writers = None
         self.endpoint_file = f"{model.name}.mpend"
         self.pathline_file = f"{model.name}.mppth"
         self.time_ser_file = f"{model.name}.mp.tim_ser"
@@ -151,8 +198,22 @@ class Modpath6Sim(Package):
             name="zone",
             locat=self.unit_number[0],
         )
-        self.retard_fac = retard_fac
-        self.retard_fcCB = retard_fcCB
+        self.retard_fac = Util3d(
+            model,
+            (nlay, nrow, ncol),
+            np.float32,
+            retard_fac,
+            name="retard_fac",
+            locat=self.unit_number[0],
+        )
+        self.retard_fcCB = Util3d(
+            model,
+            (nlay, nrow, ncol),
+            np.float32,
+            retard_fcCB,
+            name="retard_fcCB",
+            locat=self.unit_number[0],
+        )
 
         # self.mask_nlay = Util3d(model,(nlay,nrow,ncol),np.int32,\
         # mask_nlay,name='mask_nlay',locat=self.unit_number[0])
@@ -160,13 +221,18 @@ class Modpath6Sim(Package):
         # mask_1lay,name='mask_1lay',locat=self.unit_number[0])
         # self.stop_zone = Util3d(model,(nlay,nrow,ncol),np.int32,\
         # stop_zone,name='stop_zone',locat=self.unit_number[0])
-        # self.retard_fac = Util3d(model,(nlay,nrow,ncol),np.float32,\
-        # retard_fac,name='retard_fac',locat=self.unit_number[0])
-        # self.retard_fcCB = Util3d(model,(nlay,nrow,ncol),np.float32,\
-        # retard_fcCB,name='retard_fcCB',locat=self.unit_number[0])
 
         self.parent.add_package(self)
 
+    @property
+    def options_dict(self):
+        """
+        The option flags keyed by their Modpath 6 names, derived from
+        option_flags (read-only).
+
+        """
+        return dict(zip(self._OPTION_NAMES, self.option_flags))
+
     def check(self, f=None, verbose=True, level=1, checktype=None):
         """
         Check package data for common errors.
@@ -210,198 +276,242 @@ class Modpath6Sim(Package):
             chk.summarize()
         return chk
 
-    def write_file(self):
-        """
-        Write the package file
-
-        Returns
-        -------
-        None
-
-        """
-        # item numbers and CamelCase variable names correspond to Modpath 6 documentation
-        nrow, ncol, nlay, nper = self.parent.nrow_ncol_nlay_nper
+    # item numbers and CamelCase variable names in the _add_* methods
+    # correspond to Modpath 6 documentation
 
-        f_sim = open(self.fn_path, "w")
+    def _add_names(self, parts):
         # item 0
-        f_sim.write(f"#{self.heading1}\n#{self.heading2}\n")
+        parts.append(f"#{self.heading1}\n#{self.heading2}\n")
         # item 1
-        f_sim.write(f"{self.mp_name_file}\n")
+        parts.append(f"{self.mp_name_file}\n")
         # item 2
-        f_sim.write(f"{self.mp_list_file}\n")
+        parts.append(f"{self.mp_list_file}\n")
         # item 3
-        for i in range(12):
-            f_sim.write(f"{self.option_flags[i]:4d}")
-        f_sim.write("\n")
-
+        parts.append(self._FLAG_FMT % tuple(self.option_flags[:12]))
         # item 4
-        f_sim.write(f"{self.endpoint_file}\n")
+        parts.append(f"{self.endpoint_file}\n")
+
+    def _add_pathline_file(self, parts):
         # item 5
-        if self.options_dict["SimulationType"] == 2:
-            f_sim.write(f"{self.pathline_file}\n")
+        parts.append(f"{self.pathline_file}\n")
+
+    def _add_time_series_file(self, parts):
         # item 6
-        if self.options_dict["SimulationType"] == 3:
-            f_sim.write(f"{self.time_ser_file}\n")
+        parts.append(f"{self.time_ser_file}\n")
+
+    def _add_advobs_file(self, parts):
         # item 7
-        if (
-            self.options_dict["AdvectiveObservationsOption"] == 2
-            and self.option_dict["SimulationType"] == 3
-        ):
-            f_sim.write(f"{self.advobs_file}\n")
+        parts.append(f"{self.advobs_file}\n")
 
+    def _add_ref_time(self, parts):
         # item 8
-        if self.options_dict["ReferenceTimeOption"] == 1:
-            f_sim.write(f"{self.ref_time:f}\n")
+        parts.append(f"{self.ref_time:f}\n")
+
+    def _add_ref_time_per_stp(self, parts):
         # item 9
-        if self.options_dict["ReferenceTimeOption"] == 2:
-            Period, Step, TimeFraction = self.ref_time_per_stp
-            f_sim.write(f"{Period + 1} {Step + 1} {TimeFraction:f}\n")
+        Period, Step, TimeFraction = self.ref_time_per_stp
+        parts.append(f"{Period + 1} {Step + 1} {TimeFraction:f}\n")
 
+    def _add_stop_time(self, parts):
         # item 10
-        if self.options_dict["StopOption"] == 3:
-            f_sim.write(f"{self.stop_time:f}\n")
-
-        if self.options_dict["ParticleGenerationOption"] == 1:
-            # item 11
-            f_sim.write(f"{self.group_ct}\n")
-            for i in range(self.group_ct):
-                # item 12
-                f_sim.write(f"{self.group_name[i]}\n")
-                # item 13
-                (
+        parts.append(f"{self.stop_time:f}\n")
+
+    def _add_particle_groups(self, parts):
+        # item 11
+        parts.append(f"{self.group_ct}\n")
+        for i in range(self.group_ct):
+            # item 12
+            parts.append(f"{self.group_name[i]}\n")
+            # item 13
+            (
+                Grid,
+                GridCellRegionOption,
+                PlacementOption,
+                ReleaseStartTime,
+                ReleaseOption,
+                CHeadOption,
+            ) = self.group_placement[i]
+            parts.append(
+                "{0:d} {1:d} {2:d} {3:f} {4:d} {5:d}\n".format(
                     Grid,
                     GridCellRegionOption,
                     PlacementOption,
                     ReleaseStartTime,
                     ReleaseOption,
                     CHeadOption,
-                ) = self.group_placement[i]
-                f_sim.write(
-                    "{0:d} {1:d} {2:d} {3:f} {4:d} {5:d}\n".format(
-                        Grid,
-                        GridCellRegionOption,
-                        PlacementOption,
-                        ReleaseStartTime,
-                        ReleaseOption,
-                        CHeadOption,
-                    )
                 )
-                # item 14
-                if ReleaseOption == 2:
-                    (
-                        ReleasePeriodLength,
-                        ReleaseEventCount,
-                    ) = self.release_times[i]
-                    f_sim.write(
-                        f"{ReleasePeriodLength:f} {ReleaseEventCount}\n"
+            )
+            # item 14
+            if ReleaseOption == 2:
+                (
+                    ReleasePeriodLength,
+                    ReleaseEventCount,
+                ) = self.release_times[i]
+                parts.append(f"{ReleasePeriodLength:f} {ReleaseEventCount}\n")
+            # item 15
+            if GridCellRegionOption == 1:
+                (
+                    MinLayer,
+                    MinRow,
+                    MinColumn,
+                    MaxLayer,
+                    MaxRow,
+                    MaxColumn,
+                ) = self.group_region[i]
+                parts.append(
+                    "{0:d} {1:d} {2:d} {3:d} {4:d} {5:d}\n".format(
+                        MinLayer + 1,
+                        MinRow + 1,
+                        MinColumn + 1,
+                        MaxLayer + 1,
+                        MaxRow + 1,
+                        MaxColumn + 1,
                     )
-                # item 15
-                if GridCellRegionOption == 1:
+                )
+            # item 16
+            if GridCellRegionOption == 2:
+                parts.append(self.mask_nlay[i].get_file_entry())
+                # item 17
+            if GridCellRegionOption == 3:
+                parts.append(f"{self.mask_layer[i]}\n")
+                # item 18
+                parts.append(self.mask_1lay[i].get_file_entry())
+            # item 19 and 20
+            if PlacementOption == 1:
+                parts.append(f"{self.face_ct[i]}\n")
+                # item 20
+                for j in range(self.face_ct[i]):
                     (
-                        MinLayer,
-                        MinRow,
-                        MinColumn,
-                        MaxLayer,
-                        MaxRow,
-                        MaxColumn,
-                    ) = self.group_region[i]
-                    f_sim.write(
-                        "{0:d} {1:d} {2:d} {3:d} {4:d} {5:d}\n".format(
-                            MinLayer + 1,
-                            MinRow + 1,
-                            MinColumn + 1,
-                            MaxLayer + 1,
-                            MaxRow + 1,
-                            MaxColumn + 1,
-                        )
+                        IFace,
+                        ParticleRowCount,
+                        ParticleColumnCount,
+                    ) = self.ifaces[i][j]
+                    parts.append(
+                        f"{IFace} {ParticleRowCount} {ParticleColumnCount}\n"
                     )
-                # item 16
-                if GridCellRegionOption == 2:
-                    f_sim.write(self.mask_nlay[i].get_file_entry())
-                    # item 17
-                if GridCellRegionOption == 3:
-                    f_sim.write(f"{self.mask_layer[i]}\n")
-                    # item 18
-                    f_sim.write(self.mask_1lay[i].get_file_entry())
-                # item 19 and 20
-                if PlacementOption == 1:
-                    f_sim.write(f"{self.face_ct[i]}\n")
-                    # item 20
-                    for j in range(self.face_ct[i]):
-                        (
-                            IFace,
-                            ParticleRowCount,
-                            ParticleColumnCount,
-                        ) = self.ifaces[i][j]
-                        f_sim.write(
-                            f"{IFace} {ParticleRowCount} {ParticleColumnCount}\n"
-                        )
-                # item 21
-                elif PlacementOption == 2:
-                    (
+            # item 21
+            elif PlacementOption == 2:
+                (
+                    ParticleLayerCount,
+                    ParticleRowCount,
+                    ParticleColumnCount,
+                ) = self.particle_cell_cnt[i]
+                parts.append(
+                    "{0:d} {1:d} {2:d} \n".format(
                         ParticleLayerCount,
                         ParticleRowCount,
                         ParticleColumnCount,
-                    ) = self.particle_cell_cnt[i]
-                    f_sim.write(
-                        "{0:d} {1:d} {2:d} \n".format(
-                            ParticleLayerCount,
-                            ParticleRowCount,
-                            ParticleColumnCount,
-                        )
                     )
+                )
 
+    def _add_strt_file(self, parts):
         # item 22
-        if self.options_dict["ParticleGenerationOption"] == 2:
-            f_sim.write(f"{self.strt_file}\n")
-
-        if self.options_dict["TimePointOption"] != 1:
-            # item 23
-            if (
-                self.options_dict["TimePointOption"] == 2
-                or self.options_dict["TimePointOption"] == 3
-            ):
-                f_sim.write(f"{self.time_ct}\n")
-            # item 24
-            if self.options_dict["TimePointOption"] == 2:
-                f_sim.write(f"{self.release_time_incr:f}\n")
-            # item 25
-            if self.options_dict["TimePointOption"] == 3:
-                for r in range(self.time_ct):
-                    f_sim.write(f"{self.time_pts[r]:f}\n")
+        parts.append(f"{self.strt_file}\n")
+
+    def _add_release_time_incr(self, parts):
+        # item 23
+        parts.append(f"{self.time_ct}\n")
+        # item 24
+        parts.append(f"{self.release_time_incr:f}\n")
+
+    def _add_time_pts(self, parts):
+        # item 23
+        parts.append(f"{self.time_ct}\n")
+        # item 25
+        for r in range(self.time_ct):
+            parts.append(f"{self.time_pts[r]:f}\n")
+
+    def _add_budget_cells(self, parts):
+        # item 26
+        parts.append(f"{self.cell_bd_ct}\n")
+        # item 27
+        for k in range(self.cell_bd_ct):
+            Grid, Layer, Row, Column = self.bud_loc[k]
+            parts.append(f"{Grid} {Layer + 1} {Row + 1} {Column + 1} \n")
+
+    def _add_trace(self, parts):
+        # item 28
+        parts.append(f"{self.trace_file}\n")
+        # item 29
+        parts.append(f"{self.trace_id}\n")
+
+    def _add_zones(self, parts):
+        # item 30
+        parts.append(f"{self.stop_zone}\n")
+        # item 31
+        parts.append(self.zone.get_file_entry(cache=True))
+
+    def _add_retardation(self, parts):
+        # item 32
+        parts.append(self.retard_fac.get_file_entry(cache=True))
+        # item 33
+        parts.append(self.retard_fcCB.get_file_entry(cache=True))
+
+    def _get_item_writers(self):
+        """
+        Get the _add_* methods that write the simulation file items used by
+        the current option flags, in file order. The selection is made once
+        per option flag configuration and rebuilt when the flags change.
 
-        if (
-            self.options_dict["BudgetOutputOption"] != 1
-            or self.options_dict["BudgetOutputOption"] != 2
-        ):
-            # item 26
-            if self.options_dict["BudgetOutputOption"] == 3:
-                f_sim.write(f"{self.cell_bd_ct}\n")
-                # item 27
-                for k in range(self.cell_bd_ct):
-                    Grid, Layer, Row, Column = self.bud_loc[k]
-                    f_sim.write(
-                        f"{Grid} {Layer + 1} {Row + 1} {Column + 1} \n"
-                    )
-            if self.options_dict["BudgetOutputOption"] == 4:
-                # item 28
-                f_sim.write(f"{self.trace_file}\n")
-                # item 29
-                f_sim.write(f"{self.trace_id}\n")
+        Returns
+        -------
+        list of methods
 
-        if self.options_dict["ZoneArrayOption"] != 1:
-            # item 30
-            f_sim.write(f"{self.stop_zone}\n")
-            # item 31
-            f_sim.write(self.zone.get_file_entry())
+        """
+        flags = tuple(self.option_flags[:12])
+        if self._item_writers is not None and self._item_writers[0] == flags:
+            return self._item_writers[1]
+
+        od = dict(zip(self._OPTION_NAMES, flags))
+
+        writers = [self._add_names]
+        if od["SimulationType"] == 2:
+            writers.append(self._add_pathline_file)
+        if od["SimulationType"] == 3:
+            writers.append(self._add_time_series_file)
+            if od["AdvectiveObservationsOption"] == 2:
+                writers.append(self._add_advobs_file)
+        if od["ReferenceTimeOption"] == 1:
+            writers.append(self._add_ref_time)
+        if od["ReferenceTimeOption"] == 2:
+            writers.append(self._add_ref_time_per_stp)
+        if od["StopOption"] == 3:
+            writers.append(self._add_stop_time)
+        if od["ParticleGenerationOption"] == 1:
+            writers.append(self._add_particle_groups)
+        if od["ParticleGenerationOption"] == 2:
+            writers.append(self._add_strt_file)
+        if od["TimePointOption"] == 2:
+            writers.append(self._add_release_time_incr)
+        if od["TimePointOption"] == 3:
+            writers.append(self._add_time_pts)
+        if od["BudgetOutputOption"] == 3:
+            writers.append(self._add_budget_cells)
+        if od["BudgetOutputOption"] == 4:
+            writers.append(self._add_trace)
+        if od["ZoneArrayOption"] != 1:
+            writers.append(self._add_zones)
+        if od["RetardationOption"] != 1:
+            writers.append(self._add_retardation)
+
+        self._item_writers = (flags, writers)
+        return writers
 
-        if self.options_dict["RetardationOption"] != 1:
-            # item 32
-            f_sim.write(self.retard_fac.get_file_entry())
-            # item 33
-            f_sim.write(self.retard_fcCB.get_file_entry())
+    def write_file(self):
+        """
+        Write the package file
+
+        Returns
+        -------
+        None
 
-        f_sim.close()
+        """
+        # collect the file contents and write them at once
+        parts = []
+        for add_items in self._get_item_writers():
+            add_items(parts)
+        with open(self.fn_path, "wb", buffering=_BUFFER_SIZE) as f_sim:
+            f_sim.write("".join(parts).encode())
 
 
 class StartingLocationsFile(Package):
@@ -452,12 +562,12 @@ class StartingLocationsFile(Package):
         """
         dtype = np.dtype(
             [
-                ("particleid", int),
-                ("particlegroup", int),
-                ("initialgrid", int),
-                ("k0", int),
-                ("i0", int),
-                ("j0", int),
+                ("particleid", _INDEX_DTYPE),
+                ("particlegroup", _INDEX_DTYPE),
+                ("initialgrid", _INDEX_DTYPE),
+                ("k0", _INDEX_DTYPE),
+                ("i0", _INDEX_DTYPE),
+                ("j0", _INDEX_DTYPE),
                 ("xloc0", np.float32),
                 ("yloc0", np.float32),
                 ("zloc0", np.float32),
@@ -470,7 +580,11 @@ class StartingLocationsFile(Package):
 
     @staticmethod
     def get_empty_starting_locations_data(
-        npt=0, default_xloc0=0.5, default_yloc0=0.5, default_zloc0=0.0
+        npt=0,
+        default_xloc0=0.5,
+        default_yloc0=0.5,
+        default_zloc0=0.0,
+        as_dict=False,
     ):
         """get an empty recarray for particle starting location info.
 
@@ -478,49 +592,106 @@ class StartingLocationsFile(Package):
         ----------
         npt : int
             Number of particles. Particles in array will be numbered consecutively from 1 to npt.
+        as_dict : bool
+            If True, return a dict with one array per field instead of a
+            recarray. The column arrays are contiguous, which is faster to
+            write for large numbers of particles. (default is False)
 
         """
         dtype = StartingLocationsFile.get_dtypes()
-        d = np.zeros(npt, dtype=dtype)
-        d = d.view(np.recarray)
-        d["particleid"] = np.arange(1, npt + 1)
-        d["particlegroup"] = 1
-        d["initialgrid"] = 1
-        d["xloc0"] = default_xloc0
-        d["yloc0"] = default_yloc0
-        d["zloc0"] = default_zloc0
-        d["groupname"] = "group1"
+        if as_dict:
+            d = {
+                name: np.zeros(npt, dtype=dtype[name]) for name in dtype.names
+            }
+        else:
+            d = np.zeros(npt, dtype=dtype)
+            d = d.view(np.recarray)
+        d["particleid"][:] = np.arange(1, npt + 1, dtype=_INDEX_DTYPE)
+        d["particlegroup"][:] = 1
+        d["initialgrid"][:] = 1
+        d["xloc0"][:] = default_xloc0
+        d["yloc0"][:] = default_yloc0
+        d["zloc0"][:] = default_zloc0
+        d["groupname"][:] = "group1"
         return d
 
-    def write_file(self, data=None, float_format="{:.8f}"):
+    def write_file(
+        self, data=None, float_format="{:.8f}", fmt="loc", chunksize=100000
+    ):
+        """
+        Write the starting locations file.
+
+        Parameters
+        ----------
+        data : np.recarray or dict
+            Particle starting location data, as returned by
+            get_empty_starting_locations_data. If None, self.data is written.
+        float_format : str
+            Python format string used for the particle coordinates and
+            initial time (default is "{:.8f}").
+        fmt : str
+            Output format. "loc" (default) writes the MODPATH 6 starting
+            locations file. "parquet" writes the particle data, with
+            zero-based k0, i0 and j0, to a Parquet file next to the loc file
+            using pyarrow. MODPATH cannot read the Parquet file, it is only
+            intended for postprocessing the particle data.
+        chunksize : int
+            Number of particles, at least 1, formatted at a time when the loc
+            file is written (default is 100000).
+
+        Returns
+        -------
+        None
+
+        """
+        if fmt not in ("loc", "parquet"):
+            raise ValueError(f"unsupported starting locations format: {fmt}")
+        if chunksize < 1:
+            raise ValueError(f"chunksize must be at least 1, got {chunksize}")
         if data is None:
             data = self.data
-        if len(data) == 0:
+        if len(data["particleid"]) == 0:
             print("No data to write!")
             return
-        data = data.copy()
-        data["k0"] += 1
-        data["i0"] += 1
-        data["j0"] += 1
-        if pd is not None and self.use_pandas and len(data) > 0:
-            self._write_particle_data_with_pandas(data, float_format)
+        if fmt == "parquet":
+            self._write_arrow(
+                data, f"{os.path.splitext(self.fn_path)[0]}.parquet"
+            )
+            return
+        # one-based cell indices, computed separately so the rest of the
+        # particle data does not need to be copied
+        k0 = data["k0"] + 1
+        i0 = data["i0"] + 1
+        j0 = data["j0"] + 1
+        if pd is not None and self.use_pandas:
+            self._write_particle_data_with_pandas(
+                data, k0, i0, j0, float_format, chunksize
+            )
         else:
-            self._write_wo_pandas(data, float_format)
+            self._write_wo_pandas(data, k0, i0, j0, float_format, chunksize)
 
-    def _write_particle_data_with_pandas(self, data, float_format):
+    def _write_particle_data_with_pandas(
+        self, data, k0, i0, j0, float_format, chunksize
+    ):
         """
         write particle data with pandas, more than twice as efficient
         :param data: particle data, pd.Dataframe or numpy record array with keys:
                           ['k0', 'i0', 'j0', 'groupname', 'particlegroup', 'xloc0', 'yloc0', 'zloc0',
                           'initialtime', 'label']
+        :param k0, i0, j0: one-based cell indices, used instead of the
+                          zero-based ones in data
+        :param chunksize: number of particles written per to_csv call
         :param save_group_mapper bool, if true, save a groupnumber to group name mapper as well.
         :return:
         """
-        # convert float format string to pandas float format
-        float_format = (
-            float_format.replace("{", "").replace("}", "").replace(":", "%")
+        float_format = _printf_format(float_format)
+        cellids = {"k0": k0, "i0": i0, "j0": j0}
+        data = pd.DataFrame(
+            {
+                name: cellids[name] if name in cellids else data[name]
+                for name in self.get_dtypes().names
+            }
         )
-        data = pd.DataFrame(data)
         if len(data) == 0:
             return
         # check if byte strings and decode
@@ -532,59 +703,90 @@ class StartingLocationsFile(Package):
         # write loc file with pandas to save time
         # simple speed test writing particles with flopy and running model took 30 min, writing with pandas took __min
         loc_path = self.fn_path
-        # write groups
-        group_dict = dict(
-            data[["particlegroup", "groupname"]].itertuples(False, None)
+        # group names and particle counts, ordered by group number
+        names = data.groupby("particlegroup")["groupname"].first()
+        counts = data["particlegroup"].value_counts().sort_index()
+        group_count = len(names)
+        groups = "".join(f"{g}\n{npt}\n" for g, npt in zip(names, counts))
+        header = "{}\n{:d}\n{}\n".format(
+            self.heading, self.input_style, group_count
         )
+        # the text is encoded once per chunk and written in binary mode to
+        # bypass the per-write overhead of the text layer
+        with open(loc_path, "wb", buffering=_BUFFER_SIZE) as f:
+            f.write((header + groups).encode())
+
+            # write particle data in chunks of rows so the text of only one
+            # chunk is held in memory at a time
+            print("writing loc particle data")
+            for start in range(0, len(data), chunksize):
+                f.write(
+                    _to_csv(
+                        data.iloc[start : start + chunksize][_OUT_COLS],
+                        float_format=float_format,
+                    ).encode()
+                )
 
-        # writing group loc data
-        groups = (
-            data[["particlegroup", "groupname"]]
-            .groupby("particlegroup")
-            .count()
-            .reset_index()
-            .rename(columns={"groupname": "count"})
-        )
-        groups.loc[:, "groupname"] = groups.loc[:, "particlegroup"].replace(
-            group_dict
-        )
-        group_count = len(groups.index)
-        groups = pd.Series(
-            groups[["groupname", "count"]].astype(str).values.flatten()
-        )
-        with open(loc_path, "w") as f:
-            f.write("{}\n".format(self.heading))
-            f.write("{:d}\n".format(self.input_style))
-            f.write("{}\n".format(group_count))
-
-        groups.to_csv(loc_path, sep=" ", index=False, header=False, mode="a")
-
-        # write particle data
-        print("writing loc particle data")
-        data.drop("groupname", 1, inplace=True)
-        data.to_csv(
-            loc_path,
-            sep=" ",
-            header=False,
-            index=False,
-            mode="a",
-            float_format=float_format,
-        )
+    def _write_arrow(self, data, path):
+        """
+        Write particle data to a Parquet file with pyarrow.
 
-    def _write_wo_pandas(self, data, float_format):
-        with open(self.fn_path, "w") as output:
-            output.write(f"{self.heading}\n")
-            output.write(f"{self.input_style}\n")
-            groups = np.unique(data.groupname)
-            ngroups = len(groups)
-            output.write(f"{ngroups}\n")
-            for g in groups:
-                npt = len(data[data.groupname == g])
-                output.write(f"{g.decode()}\n{npt}\n")
-            txt = ""
-            for p in data:
-                txt += "{:d} {:d} {:d} {:d} {:d} {:d}".format(*list(p)[:6])
-                fmtstr = " {0} {0} {0} {0} ".format(float_format)
-                txt += fmtstr.format(*list(p)[6:10])
-                txt += f"{p[10].decode()}\n"
-            output.write(txt)
+        Parameters
+        ----------
+        data : np.recarray or dict
+            Particle starting location data.
+        path : str
+            Path of the Parquet file.
+
+        """
+        pa = import_optional_dependency(
+            "pyarrow",
+            error_message="writing particles to parquet requires pyarrow",
+        )
+        pq = import_optional_dependency("pyarrow.parquet")
+        columns = {}
+        for name in self.get_dtypes().names:
+            column = np.asarray(data[name])
+            if column.dtype.kind == "S":
+                column = np.char.decode(column, "utf-8")
+            columns[name] = column
+        pq.write_table(pa.table(columns), path, compression="snappy")
+
+    def _write_wo_pandas(self, data, k0, i0, j0, float_format, chunksize):
+        groups, counts = np.unique(data["groupname"], return_counts=True)
+        gnames = np.char.decode(groups, "utf-8")
+        header = f"{self.heading}\n{self.input_style}\n{len(groups)}\n"
+        header += "".join(f"{g}\n{npt}\n" for g, npt in zip(gnames, counts))
+
+        # format each column of a chunk of particles in a single vectorized
+        # pass and join the rows as python strings, rather than formatting
+        # and concatenating row by row
+        float_format = _printf_format(float_format)
+        # the text is encoded once per chunk and written in binary mode to
+        # bypass the per-write overhead of the text layer
+        with open(self.fn_path, "wb", buffering=_BUFFER_SIZE) as output:
+            output.write(header.encode())
+            for start in range(0, len(k0), chunksize):
+                end = start + chunksize
+                # integer columns are converted with astype, which formats
+                # in C without a python-level % call per element
+                columns = [
+                    column[start:end].astype(str)
+                    for column in (
+                        data["particleid"],
+                        data["particlegroup"],
+                        data["initialgrid"],
+                        k0,
+                        i0,
+                        j0,
+                    )
+                ]
+                columns += [
+                    np.char.mod(float_format, data[name][start:end])
+                    for name in ("xloc0", "yloc0", "zloc0", "initialtime")
+                ]
+                columns.append(
+                    np.char.decode(data["label"][start:end], "utf-8")
+                )
+                lines = map(" ".join, zip(*(c.tolist() for c in columns)))
+                output.write(("\n".join(lines) + "\n").encode())
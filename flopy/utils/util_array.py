@@ -8,6 +8,7 @@ util_array module.  Contains the util_2d, util_3d and transient_2d classes.
 # from future.utils import with_metaclass
 
 import copy
+import hashlib
 import os
 import shutil
 from warnings import warn
@@ -748,10 +749,25 @@ class Util3d(DataInterface):
         else:
             raise Exception(f"Util3d error: unsupported indices: {k}")
 
-    def get_file_entry(self):
+    def get_file_entry(self, cache=False):
+        """
+        Get the file entry of each layer.
+
+        Parameters
+        ----------
+        cache : bool
+            Reuse the text of internal layers whose values have not changed
+            since the previous call, see Util2d.get_file_entry.
+            (default is False)
+
+        Returns
+        -------
+        str
+
+        """
         s = ""
         for u2d in self.util_2ds:
-            s += u2d.get_file_entry()
+            s += u2d.get_file_entry(cache=cache)
         return s
 
     def get_value(self):
@@ -1866,6 +1882,8 @@ class Util2d(DataInterface):
         if self.vtype == str:
             fmtin = "(FREE)"
         self.__value_built = None
+        # (key, text) of the last array text built by _get_cached_string
+        self._string_cache = None
         self.cnstnt = dtype(cnstnt)
 
         self.iprn = iprn
@@ -2275,7 +2293,26 @@ class Util2d(DataInterface):
         else:
             return self._get_fixed_cr(locat)
 
-    def get_file_entry(self, how=None):
+    def get_file_entry(self, how=None, cache=False):
+        """
+        Get the control record and, for internal arrays, the array text.
+
+        Parameters
+        ----------
+        how : str, optional
+            One of "constant", "internal", "external", or "openclose".
+            Defaults to the how attribute.
+        cache : bool
+            If True, the text of an internal array is kept and reused by
+            later calls while its values, shape and python format are
+            unchanged. Useful when a package is written repeatedly.
+            (default is False)
+
+        Returns
+        -------
+        str
+
+        """
         if how is not None:
             how = how.lower()
         else:
@@ -2311,6 +2348,8 @@ class Util2d(DataInterface):
                 not self.format.binary
             ), "Util2d error: 'how' is internal, but format is binary"
             cr = self.get_internal_cr()
+            if cache:
+                return cr + self._get_cached_string()
             return cr + self.string
 
         elif how == "external" or how == "openclose":
@@ -2383,6 +2422,24 @@ class Util2d(DataInterface):
                 f"Util2d.get_file_entry() error: unrecognized 'how':{how}"
             )
 
+    def _get_cached_string(self):
+        """
+        get the string attribute, reusing the text from the previous call
+        if the values, shape and python format are unchanged
+        """
+        a = np.ascontiguousarray(self._array)
+        key = (
+            self.format.py,
+            a.shape,
+            a.dtype.str,
+            hashlib.blake2b(a, digest_size=16).digest(),
+        )
+        cached = self._string_cache
+        if cached is None or cached[0] != key:
+            cached = (key, self.string)
+            self._string_cache = cached
+        return cached[1]
+
     @property
     def string(self):
         """